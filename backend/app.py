@@ -4,28 +4,65 @@ A personal memory digitizer that processes images and audio files.
 """
 
 import os
+
+# Tesseract's OpenMP threading is slower than running one thread per image;
+# parallelism comes from uvicorn workers (UVICORN_WORKERS) instead.
+# Must be set before the OCR libraries are imported. Whisper sets its own
+# thread count (WHISPER_CPU_THREADS in asr_utils), so this doesn't cap it.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import sys
+import logging
 import uuid
+import hashlib
 import asyncio
-from datetime import datetime
+import threading
+import functools
+import concurrent.futures
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, BackgroundTasks, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+import aiofiles
 import uvicorn
 
-from db import get_db_connection, init_database, create_memory, get_memory_by_id, search_memories
-from ocr_utils import extract_text_from_image, extract_exif_data
-from asr_utils import transcribe_audio
-from sentiment_utils import analyze_sentiment
+from db import (
+    init_database, create_memory, get_memory_by_id, get_memory_status, get_all_memories,
+    get_memories_version,
+    search_memories, update_memory, optimize_database, close_db_connection,
+    claim_pending_memories, heartbeat_worker, unregister_worker
+)
+from ocr_utils import (
+    extract_text, extract_text_batch, extract_exif_data, process_image,
+    load_ocr_backend, OCR_BACKEND
+)
+from asr_utils import transcribe_audio_file, load_whisper_model
+from sentiment_utils import analyze_sentiment_batch
+from pipeline import AsyncTaskPipeline, PipelineStage
+
+# OCR and sentiment modules log through `logging`; per-file progress is at
+# DEBUG level, so set LOG_LEVEL=DEBUG to see it
+LOG_CONFIG = dict(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logging.basicConfig(**LOG_CONFIG)
 
 # Create FastAPI app instance
 app = FastAPI(
     title="MemoriaVault API",
     description="Personal memory digitizer with OCR and ASR capabilities",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes large memory lists several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for React frontend
@@ -41,22 +78,309 @@ app.add_middleware(
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Whisper model size (tiny, base, small, medium, large)
+WHISPER_SIZE = os.environ.get("WHISPER_SIZE", "small")
+
+# Leading bytes ("magic numbers") that identify supported upload formats,
+# with the media type and the extension the file is stored under
+MEDIA_SIGNATURES = (
+    (b"\xff\xd8\xff", "image", ".jpg"),        # JPEG
+    (b"\x89PNG\r\n\x1a\n", "image", ".png"),   # PNG
+    (b"ID3", "audio", ".mp3"),                 # MP3 with ID3 tag
+    (b"\xff\xfb", "audio", ".mp3"),            # MP3 frame sync (MPEG-1/2 layer III)
+    (b"\xff\xf3", "audio", ".mp3"),
+    (b"\xff\xf2", "audio", ".mp3"),
+    (b"OggS", "audio", ".ogg"),                # Ogg (Vorbis/Opus)
+    (b"fLaC", "audio", ".flac"),               # FLAC
+)
+
+def sniff_media_type(head: bytes) -> Optional[Tuple[str, str]]:
+    """
+    Detect an upload's media type and file extension from its first bytes.
+    
+    The client's Content-Type header and filename can be wrong or forged.
+    Sending an image to Whisper (or audio to Tesseract) wastes the slowest
+    pipeline stage on a file that can only fail, and /media serves stored
+    files with a Content-Type picked from their extension.
+    
+    Args:
+        head: Leading bytes of the uploaded file (at least 12)
+        
+    Returns:
+        ('image' or 'audio', extension such as '.jpg'), or None if the
+        format is not supported
+    """
+    for signature, media_type, extension in MEDIA_SIGNATURES:
+        if head.startswith(signature):
+            return media_type, extension
+    # WAV: RIFF container with a WAVE form type
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "audio", ".wav"
+    # MP4/M4A audio: ISO base media 'ftyp' box at offset 4
+    if head[4:8] == b"ftyp" and head[8:11] in (b"M4A", b"mp4", b"iso"):
+        return "audio", ".m4a"
+    return None
+
+# Audio uploads up to this size are handed to the ASR stage in memory
+INLINE_AUDIO_MAX_BYTES = 4 * 1024 * 1024  # 4MB
+
 # Mount static files to serve uploaded media
 app.mount("/media", StaticFiles(directory="uploads"), name="media")
 
+# Number of uvicorn worker processes started by `python app.py`
+UVICORN_WORKERS = int(os.environ.get("UVICORN_WORKERS", "4"))
+
+# CPU-bound OCR, EXIF and sentiment work runs in separate processes so it
+# isn't serialized by the GIL and several uploads are processed in parallel.
+# Every uvicorn worker has its own pool, so by default the cores are split
+# between them; set CPU_WORKERS when running several workers another way.
+CPU_WORKERS = int(os.environ.get(
+    "CPU_WORKERS", max(1, (os.cpu_count() or 1) // UVICORN_WORKERS)
+))
+
+# Created in startup_event: forking this multi-threaded process could copy
+# a lock held by another thread into the child and deadlock it, so workers
+# come from a clean forkserver process instead (spawn on Windows)
+PROC_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_proc_pool_lock = threading.Lock()
+
+def create_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Start the CPU worker pool with a fork-safe start method."""
+    if sys.platform == "win32":
+        mp_context = multiprocessing.get_context("spawn")
+    else:
+        mp_context = multiprocessing.get_context("forkserver")
+        # Workers fork from a server that already imported the OCR and
+        # sentiment modules, instead of importing them for every process
+        mp_context.set_forkserver_preload(["ocr_utils", "sentiment_utils"])
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=CPU_WORKERS,
+        mp_context=mp_context,
+        # Fresh worker processes don't inherit this module's logging setup
+        initializer=functools.partial(logging.basicConfig, **LOG_CONFIG)
+    )
+
+def restart_process_pool(broken_pool: concurrent.futures.ProcessPoolExecutor):
+    """Replace the CPU worker pool after one of its processes died."""
+    global PROC_POOL
+    
+    with _proc_pool_lock:
+        # Another stage thread may have replaced it already
+        if PROC_POOL is broken_pool:
+            print("⚠️ A CPU worker process died, restarting the worker pool")
+            broken_pool.shutdown(wait=False)
+            PROC_POOL = create_process_pool()
+
+def retry_on_broken_pool(stage):
+    """
+    Retry a pipeline stage once on a fresh pool if a worker process died.
+    
+    A worker killed mid-job (OOM, a crash in OpenCV or Tesseract on a bad
+    image) breaks the whole pool, so without a restart every later upload
+    would fail until the server restarts.
+    """
+    @functools.wraps(stage)
+    def wrapper(jobs):
+        pool = PROC_POOL
+        try:
+            return stage(jobs)
+        except BrokenProcessPool:
+            restart_process_pool(pool)
+        
+        pool = PROC_POOL
+        try:
+            return stage(jobs)
+        except BrokenProcessPool:
+            # The batch itself may be what kills the worker; give up on it
+            # but leave a working pool for the next one
+            restart_process_pool(pool)
+            raise
+    return wrapper
+
+# Score upload sentiment with VADER only (set FAST_SENTIMENT=0 to average
+# TextBlob and VADER, which is several times slower on long texts)
+FAST_SENTIMENT = os.environ.get("FAST_SENTIMENT", "1") != "0"
+
+# Images waiting for OCR are handed to one Tesseract engine in groups of up
+# to this many, instead of starting Tesseract once per image
+OCR_BATCH_SIZE = 8
+
+# Upload pipeline stages
+# Each stage runs on its own thread(s) and receives the job dict from the
+# previous one: OCR/ASR -> sentiment -> database.
+
+@retry_on_broken_pool
+def ocr_stage(jobs: List[dict]) -> List[dict]:
+    """Extract text and EXIF metadata (date, location) from a batch of images."""
+    paths = [job['file_path'] for job in jobs]
+    
+    # A single image is read and decoded once for both OCR and EXIF
+    if OCR_BACKEND == "tesseract" and len(paths) == 1:
+        text, exif_data = PROC_POOL.submit(process_image, paths[0]).result()
+        jobs[0].update(text=text, date=exif_data.get('date'), location=exif_data.get('location'))
+        return jobs
+    
+    exif_futures = [PROC_POOL.submit(extract_exif_data, path) for path in paths]
+    
+    # GPU OCR engines are loaded once in this process; only Tesseract is
+    # cheap to run in the worker processes, where a batch shares one engine
+    if OCR_BACKEND == "tesseract":
+        texts = PROC_POOL.submit(extract_text_batch, paths).result()
+    else:
+        texts = [extract_text(path) for path in paths]
+    
+    for job, text, exif_future in zip(jobs, texts, exif_futures):
+        exif_data = exif_future.result()
+        job['text'] = text
+        job['date'] = exif_data.get('date')
+        job['location'] = exif_data.get('location')
+    return jobs
+
+def asr_stage(job: dict) -> dict:
+    """Transcribe an audio file (CTranslate2 releases the GIL, so this stays in a thread)."""
+    job['text'] = transcribe_audio_file(
+        job['file_path'], WHISPER_SIZE, audio_bytes=job.pop('audio_bytes', None)
+    )
+    return job
+
+@retry_on_broken_pool
+def sentiment_stage(jobs: List[dict]) -> List[dict]:
+    """Analyze sentiment of the extracted text for a batch of jobs."""
+    texts = [job.get('text') or "" for job in jobs]
+    scores = PROC_POOL.submit(analyze_sentiment_batch, texts, FAST_SENTIMENT).result()
+    for job, score in zip(jobs, scores):
+        job['sentiment'] = score
+    return jobs
+
+def db_stage(job: dict) -> dict:
+    """Store the processing results and mark the memory as done."""
+    update_memory(
+        job['memory_id'],
+        text=job.get('text', ""),
+        date=job.get('date'),
+        location=job.get('location'),
+        sentiment=job.get('sentiment', 0.0),
+        status='done'
+    )
+    return job
+
+def mark_failed(job: dict, error: Exception):
+    """Mark a memory as failed when any pipeline stage raises."""
+    update_memory(job['memory_id'], status='failed')
+
+_db_stage = PipelineStage("db", db_stage)
+_sentiment_stage = PipelineStage(
+    "sentiment", sentiment_stage, next_stage=_db_stage, num_workers=CPU_WORKERS, batch_size=16
+)
+pipeline = AsyncTaskPipeline(
+    entry_stages={
+        "image": PipelineStage(
+            "ocr", ocr_stage, next_stage=_sentiment_stage, num_workers=CPU_WORKERS,
+            batch_size=OCR_BATCH_SIZE
+        ),
+        "audio": PipelineStage("asr", asr_stage, next_stage=_sentiment_stage),
+    },
+    on_error=mark_failed
+)
+
+# Identifies this server process as the owner of the uploads it accepts
+WORKER_ID = uuid.uuid4().hex
+
+# Live workers refresh their heartbeat this often; pending uploads owned by a
+# worker silent for WORKER_STALE_AFTER are taken over by the others
+HEARTBEAT_INTERVAL = 30  # seconds
+WORKER_STALE_AFTER = 3 * HEARTBEAT_INTERVAL
+
+_heartbeat_task: Optional[asyncio.Task] = None
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables when the app starts."""
+    """Initialize database tables, preload the Whisper and OCR models and start the upload pipeline."""
+    global PROC_POOL, _heartbeat_task
+    
     init_database()
+    heartbeat_worker(WORKER_ID)
     print("✅ Database initialized successfully")
+    
+    # Load Whisper now so the first audio upload doesn't pay for it
+    try:
+        load_whisper_model(WHISPER_SIZE)
+    except Exception as e:
+        print(f"⚠️ Whisper preload failed, will retry on first audio upload: {str(e)}")
+    
+    # Create the GPU OCR reader once instead of on the first image
+    try:
+        load_ocr_backend(OCR_BACKEND)
+    except Exception as e:
+        print(f"⚠️ OCR backend '{OCR_BACKEND}' failed to load: {str(e)}")
+    
+    PROC_POOL = create_process_pool()
+    pipeline.start()
+    
+    # Finish uploads that a crashed or killed worker accepted but never processed
+    _heartbeat_task = asyncio.create_task(heartbeat_loop())
+
+async def heartbeat_loop():
+    """Keep this worker marked alive and take over uploads orphaned by dead workers."""
+    while True:
+        try:
+            heartbeat_worker(WORKER_ID)
+            await requeue_pending_memories()
+        except Exception as e:
+            print(f"⚠️ Could not check for unfinished uploads: {str(e)}")
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+async def requeue_pending_memories():
+    """
+    Re-submit memories left 'pending' by a worker that is no longer alive.
+    
+    Memories whose file is gone are marked 'failed' instead.
+    """
+    pending = claim_pending_memories(WORKER_ID, WORKER_STALE_AFTER)
+    
+    if pending:
+        print(f"🔄 Re-queuing {len(pending)} unfinished uploads")
+    
+    for memory in pending:
+        file_path = UPLOAD_DIR / Path(memory['media_path'] or "").name
+        if memory['media_type'] not in pipeline.entry_stages or not file_path.is_file():
+            update_memory(memory['id'], status='failed')
+            continue
+        
+        await pipeline.submit({
+            "memory_id": memory['id'],
+            "file_path": str(file_path),
+            "kind": memory['media_type'],
+            "audio_bytes": None
+        })
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish queued uploads, stop the pipeline threads and worker processes and optimize the database."""
+    if _heartbeat_task is not None:
+        _heartbeat_task.cancel()
+    
+    pipeline.stop()
+    if PROC_POOL is not None:
+        PROC_POOL.shutdown()
+    
+    # Everything this worker accepted is processed now
+    unregister_worker(WORKER_ID)
+    
+    # Keep query planner statistics fresh for the next start
+    optimize_database()
+    close_db_connection()
 
 @app.get("/")
 async def root():
     """Health check endpoint."""
     return {"message": "MemoriaVault API is running!", "status": "ok"}
 
-@app.post("/api/upload")
+@app.post("/api/upload", status_code=202)
 async def upload_memory(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
@@ -64,98 +388,105 @@ async def upload_memory(
     person: Optional[str] = Form(None)
 ):
     """
-    Upload and process a memory file (image or audio).
+    Upload a memory file (image or audio) and queue it for processing.
     
     This endpoint:
     1. Validates the uploaded file
     2. Saves it to the uploads directory
-    3. Processes the file (OCR for images, ASR for audio)
-    4. Extracts metadata (EXIF for images)
-    5. Analyzes sentiment of extracted text
-    6. Stores everything in the database
+    3. Creates the memory with status 'pending'
+    4. Hands the file to the upload pipeline, which in the background:
+       - Processes the file (OCR for images, ASR for audio)
+       - Extracts metadata (EXIF for images)
+       - Analyzes sentiment of extracted text
+       - Stores the results and sets status to 'done'
+    
+    Returns 202 with the new memory's ID right after the file is saved.
+    Poll /api/memory/{id}/status to find out when processing is finished.
     """
     try:
-        # Validate file type
-        if not file.content_type:
-            raise HTTPException(status_code=400, detail="File type not detected")
-        
-        # Check if it's an image or audio file
-        is_image = file.content_type.startswith('image/')
-        is_audio = file.content_type.startswith('audio/')
+        # Validate file type from the file's magic bytes; the first chunk is
+        # written to disk below, so nothing is read twice
+        head = await file.read(UPLOAD_CHUNK_SIZE)
+        sniffed = sniff_media_type(head)
         
-        if not (is_image or is_audio):
+        if sniffed is None:
             raise HTTPException(
                 status_code=400, 
-                detail="Only image (JPEG, PNG) and audio (MP3, WAV) files are supported"
+                detail="File type not supported; expected JPEG, PNG, WAV, MP3, Ogg, FLAC or M4A"
             )
         
-        # Generate safe filename
-        file_extension = Path(file.filename).suffix.lower()
-        safe_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = UPLOAD_DIR / safe_filename
+        media_type, file_extension = sniffed
         
-        # Save uploaded file
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Content-Type is only a hint; note when it disagrees with the file
+        if file.content_type and not file.content_type.startswith(f"{media_type}/"):
+            print(f"⚠️ Content-Type {file.content_type} does not match detected {media_type} file")
         
-        print(f"📁 File saved: {file_path}")
+        is_audio = media_type == "audio"
         
-        # Process the file based on type
-        extracted_text = ""
-        extracted_date = None
-        extracted_location = None
+        # Generate safe filename; the extension follows the detected format,
+        # not the client's filename, since /media serves files by extension
+        safe_filename = f"{uuid.uuid4()}{file_extension}"
+        file_path = UPLOAD_DIR / safe_filename
         
-        if is_image:
-            print("🖼️ Processing image with OCR...")
-            # Extract text using OCR (Optical Character Recognition)
-            extracted_text = extract_text_from_image(str(file_path))
-            
-            # Extract EXIF metadata (date, location from camera)
-            exif_data = extract_exif_data(str(file_path))
-            extracted_date = exif_data.get('date')
-            extracted_location = exif_data.get('location')
-            
-        elif is_audio:
-            print("🎵 Processing audio with ASR...")
-            # Extract text using ASR (Automatic Speech Recognition)
-            extracted_text = await transcribe_audio(str(file_path))
+        # Save uploaded file (streamed in chunks so large audio files
+        # are never held in memory as a whole, and written with aiofiles
+        # so the disk writes don't block the event loop)
+        # Small audio clips are also kept in memory for the ASR stage
+        audio_chunks = [] if is_audio else None
+        file_size = 0
+        chunk = head
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk:
+                await buffer.write(chunk)
+                file_size += len(chunk)
+                if audio_chunks is not None:
+                    if file_size <= INLINE_AUDIO_MAX_BYTES:
+                        audio_chunks.append(chunk)
+                    else:
+                        audio_chunks = None
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
         
-        # Analyze sentiment of extracted text
-        print("😊 Analyzing sentiment...")
-        sentiment_score = analyze_sentiment(extracted_text) if extracted_text else 0.0
+        print(f"📁 File saved: {file_path}")
         
-        # Store in database
-        print("💾 Storing in database...")
+        # Store the memory now; the pipeline fills in text, metadata and sentiment
         memory_id = create_memory(
             title=title,
-            text=extracted_text,
-            date=extracted_date,
-            location=extracted_location,
-            sentiment=sentiment_score,
+            text="",
+            sentiment=0.0,
             media_path=f"/media/uploads/{safe_filename}",
-            media_type="image" if is_image else "audio",
-            person=person
+            media_type=media_type,
+            person=person,
+            status='pending',
+            claimed_by=WORKER_ID
         )
         
-        # Return success response
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "ok",
-                "memory": {
-                    "id": memory_id,
-                    "title": title,
-                    "text": extracted_text,
-                    "date": extracted_date,
-                    "location": extracted_location,
-                    "sentiment": sentiment_score,
-                    "media_path": f"/media/uploads/{safe_filename}",
-                    "media_type": "image" if is_image else "audio"
-                }
+        # Queue OCR/ASR once the response has been sent
+        background_tasks.add_task(pipeline.submit, {
+            "memory_id": memory_id,
+            "file_path": str(file_path),
+            "kind": media_type,
+            "audio_bytes": b"".join(audio_chunks) if audio_chunks else None
+        })
+        
+        # Return accepted response
+        return {
+            "status": "ok",
+            "memory": {
+                "id": memory_id,
+                "title": title,
+                "text": "",
+                "date": None,
+                "location": None,
+                "sentiment": 0.0,
+                "media_path": f"/media/uploads/{safe_filename}",
+                "media_type": media_type,
+                "person": person,
+                "status": "pending"
             }
-        )
+        }
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Upload error: {str(e)}")
         # Clean up file if it was saved but processing failed
@@ -164,25 +495,66 @@ async def upload_memory(
         
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+# Clients may reuse cached memory responses for this long before revalidating
+CACHE_CONTROL = "private, max-age=30"
+
+def make_etag(*parts) -> str:
+    """Build a quoted ETag from the values that identify a response's content."""
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=8)
+    return f'"{digest.hexdigest()}"'
+
+def http_date(timestamp: Optional[str]) -> Optional[str]:
+    """Convert an SQLite UTC timestamp to an HTTP date for Last-Modified."""
+    if not timestamp:
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return format_datetime(dt, usegmt=True)
+
+def cache_headers(etag: str, last_modified: Optional[str]) -> dict:
+    """HTTP caching headers for a memory response."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    last_modified = http_date(last_modified)
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already has this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+    return etag in tags or "*" in tags
+
 @app.get("/api/memory/{memory_id}")
-async def get_memory(memory_id: int):
+async def get_memory(memory_id: int, request: Request, response: Response):
     """
     Get a specific memory by ID.
     
     Returns the memory details including the media URL.
+    Responses carry an ETag; a request with a matching If-None-Match
+    gets an empty 304 Not Modified instead.
     """
     try:
         memory = get_memory_by_id(memory_id)
         if not memory:
             raise HTTPException(status_code=404, detail="Memory not found")
         
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "ok",
-                "memory": memory
-            }
-        )
+        # updated_at changes on every write, including processing status
+        etag = make_etag(memory['id'], memory.get('updated_at'))
+        headers = cache_headers(etag, memory.get('updated_at'))
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        
+        return {
+            "status": "ok",
+            "memory": memory
+        }
         
     except HTTPException:
         raise
@@ -190,6 +562,30 @@ async def get_memory(memory_id: int):
         print(f"❌ Get memory error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve memory: {str(e)}")
 
+@app.get("/api/memory/{memory_id}/status")
+async def get_memory_processing_status(memory_id: int):
+    """
+    Get the processing status of an uploaded memory.
+    
+    processing_status is 'pending' while OCR/ASR is running, then 'done' or 'failed'.
+    """
+    try:
+        processing_status = get_memory_status(memory_id)
+        if processing_status is None:
+            raise HTTPException(status_code=404, detail="Memory not found")
+        
+        return {
+            "status": "ok",
+            "id": memory_id,
+            "processing_status": processing_status
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Get memory status error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve memory status: {str(e)}")
+
 @app.get("/api/search")
 async def search_memory(q: str):
     """
@@ -204,13 +600,10 @@ async def search_memory(q: str):
         
         results = search_memories(q.strip())
         
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "ok",
-                "results": results
-            }
-        )
+        return {
+            "status": "ok",
+            "results": results
+        }
         
     except HTTPException:
         raise
@@ -219,48 +612,45 @@ async def search_memory(q: str):
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 @app.get("/api/memories")
-async def list_memories(limit: int = 20, offset: int = 0):
+async def list_memories(
+    request: Request,
+    response: Response,
+    limit: int = 20,
+    cursor: Optional[str] = None
+):
     """
     List all memories with pagination.
     
     Returns a list of memories ordered by creation date (newest first).
+    `text` is truncated to a 240 character preview; fetch
+    /api/memory/{id} for the full text.
+    
+    Pass the returned next_cursor as `cursor` to get the next page;
+    next_cursor is null on the last page.
+    
+    The ETag is based on the memory list's change counter and latest
+    update time, so a client revalidating an unchanged page gets a 304
+    without the page being read or serialized.
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, title, text, date, location, sentiment, media_path, media_type, created_at
-            FROM memories 
-            ORDER BY created_at DESC 
-            LIMIT ? OFFSET ?
-        """, (limit, offset))
+        version, last_updated = get_memories_version()
+        etag = make_etag(version, last_updated, limit, cursor)
+        headers = cache_headers(etag, last_updated)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
         
-        memories = []
-        for row in cursor.fetchall():
-            memories.append({
-                "id": row[0],
-                "title": row[1],
-                "text": row[2],
-                "date": row[3],
-                "location": row[4],
-                "sentiment": row[5],
-                "media_path": row[6],
-                "media_type": row[7],
-                "created_at": row[8]
-            })
+        memories, next_cursor = get_all_memories(limit, cursor)
         
-        conn.close()
-        
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "ok",
-                "memories": memories,
-                "count": len(memories)
-            }
-        )
+        return {
+            "status": "ok",
+            "memories": memories,
+            "count": len(memories),
+            "next_cursor": next_cursor
+        }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"❌ List memories error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list memories: {str(e)}")
@@ -271,10 +661,26 @@ if __name__ == "__main__":
     print("📖 API docs available at: http://localhost:8000/docs")
     print("🔍 Health check at: http://localhost:8000/")
     
-    uvicorn.run(
-        "app:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,  # Auto-reload on code changes
-        log_level="info"
-    )
+    # Set MEMORIAVAULT_DEV=1 for a single auto-reloading worker
+    dev_mode = os.environ.get("MEMORIAVAULT_DEV") == "1"
+    
+    if dev_mode:
+        uvicorn.run(
+            "app:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,  # Auto-reload on code changes
+            log_level="info"
+        )
+    else:
+        # uvloop is not available on Windows, fall back to asyncio there
+        uvicorn.run(
+            "app:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            workers=UVICORN_WORKERS,
+            reload=False,
+            log_level="info"
+        )
@@ -5,23 +5,205 @@ Handles SQLite database operations and FTS5 full-text search.
 
 import sqlite3
 import os
+import re
+import base64
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 import json
 
 DATABASE_PATH = "memoriavault.db"
 
+# One long-lived connection per thread, reused across requests
+_local = threading.local()
+
+# Refresh planner statistics after this many inserts
+ANALYZE_EVERY_N_INSERTS = 500
+_inserts_since_analyze = 0
+_analyze_lock = threading.Lock()
+
+# Hot queries are kept as module constants so every call passes the exact
+# same SQL text and hits the connection's prepared statement cache
+
+# Use FTS5 to search and get snippets
+# snippet() function returns highlighted text with search terms
+# The CTE runs MATCH + ORDER BY rank + LIMIT against memories_fts alone,
+# so SQLite keeps the FTS index plan and only joins `limit` rows back
+# to memories. snippet() must stay inside the CTE because auxiliary
+# functions are only allowed in the full-text query itself.
+# The display snippet "Title: ... | Text: ..." is assembled in SQL, leaving
+# out empty parts and falling back to the plain title.
+SEARCH_MEMORIES_SQL = """
+    WITH fts AS (
+        SELECT
+            rowid,
+            rank,
+            NULLIF(snippet(memories_fts, 0, '<mark>', '</mark>', '...', 32), '') as title_snippet,
+            NULLIF(snippet(memories_fts, 1, '<mark>', '</mark>', '...', 64), '') as text_snippet
+        FROM memories_fts
+        WHERE memories_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    )
+    SELECT 
+        m.id,
+        m.title,
+        m.date,
+        m.sentiment,
+        m.media_type,
+        m.media_path,
+        COALESCE(
+            'Title: ' || fts.title_snippet || COALESCE(' | Text: ' || fts.text_snippet, ''),
+            'Text: ' || fts.text_snippet,
+            m.title
+        ) as snippet
+    FROM fts
+    JOIN memories m ON m.id = fts.rowid
+    ORDER BY fts.rank
+"""
+
+# Paginated list view (text is cut to a preview)
+# Keyset pagination: later pages seek past the last (created_at, id) seen
+# via idx_memories_created_at instead of scanning and discarding OFFSET rows
+LIST_MEMORIES_SQL = """
+    SELECT id, title, substr(text, 1, 240) AS text, date, location, sentiment,
+           media_path, media_type, person, status, created_at, updated_at
+    FROM memories 
+    ORDER BY created_at DESC, id DESC 
+    LIMIT ?
+"""
+
+LIST_MEMORIES_AFTER_SQL = """
+    SELECT id, title, substr(text, 1, 240) AS text, date, location, sentiment,
+           media_path, media_type, person, status, created_at, updated_at
+    FROM memories 
+    WHERE (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC 
+    LIMIT ?
+"""
+
 def get_db_connection() -> sqlite3.Connection:
     """
     Get a connection to the SQLite database.
     
+    The connection is opened once per thread and cached, so requests don't
+    pay for a connect + PRAGMA setup every time, and its prepared statement
+    cache survives between calls. It runs in autocommit mode
+    (isolation_level=None); writes use write_transaction() instead.
+    
     Returns:
         SQLite database connection
     """
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+    
+    conn = sqlite3.connect(
+        DATABASE_PATH,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256
+    )
     conn.row_factory = sqlite3.Row  # This allows accessing columns by name
+    
+    # WAL lets readers run while a writer is active
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+    conn.execute("PRAGMA cache_size=-65536")  # 64MB
+    # Cap how many rows each ANALYZE samples, so refreshing planner
+    # statistics stays a few milliseconds however large the table grows
+    conn.execute("PRAGMA analysis_limit=1000")
+    
+    _local.conn = conn
     return conn
 
+@contextmanager
+def write_transaction():
+    """
+    Run a block of writes inside BEGIN IMMEDIATE / COMMIT.
+    
+    The write lock is taken up front so concurrent writers wait on the
+    busy timeout instead of failing halfway through. Rolls back on error.
+    
+    Yields:
+        Cursor on the thread's cached connection
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        yield cursor
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+def close_db_connection():
+    """Close this thread's cached connection, if it has one."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+def optimize_database():
+    """
+    Let SQLite refresh the query planner statistics it is missing.
+    
+    PRAGMA optimize only runs ANALYZE on tables whose statistics are stale
+    or absent; the connection's analysis_limit caps how many rows each
+    ANALYZE looks at so this stays fast.
+    """
+    try:
+        conn = get_db_connection()
+        conn.execute("PRAGMA optimize")
+        print("✅ Database optimized")
+    except Exception as e:
+        print(f"❌ Database optimize failed: {str(e)}")
+
+def _count_insert():
+    """
+    Run ANALYZE on memories once every ANALYZE_EVERY_N_INSERTS inserts.
+    
+    Inserts happen on the upload request path, so this must stay cheap;
+    the connection's analysis_limit bounds how many rows it samples. The
+    FTS virtual table gets no sqlite_stat1 rows, so it is not analyzed.
+    """
+    global _inserts_since_analyze
+    
+    with _analyze_lock:
+        _inserts_since_analyze += 1
+        if _inserts_since_analyze < ANALYZE_EVERY_N_INSERTS:
+            return
+        _inserts_since_analyze = 0
+    
+    try:
+        conn = get_db_connection()
+        conn.execute("ANALYZE memories")
+    except Exception as e:
+        print(f"⚠️ ANALYZE failed: {str(e)}")
+
+def iter_dicts(cursor: sqlite3.Cursor, batch_size: int = 200) -> Iterator[Dict]:
+    """
+    Yield the rows of an executed query as dictionaries.
+    
+    Rows are fetched from SQLite in batches of `batch_size`, so large result
+    sets are never materialized as a whole list of Row objects first.
+    
+    Args:
+        cursor: Cursor on which a SELECT has been executed
+        batch_size: Number of rows fetched per round-trip
+        
+    Yields:
+        One dictionary per row, keyed by column name
+    """
+    cursor.arraysize = batch_size
+    while rows := cursor.fetchmany():
+        for row in rows:
+            yield dict(row)
+
 def init_database():
     """
     Initialize the database with required tables.
@@ -32,89 +214,162 @@ def init_database():
     3. memories_fts table: FTS5 virtual table for full-text search
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Create memories table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS memories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                text TEXT,
-                date TEXT,
-                location TEXT,
-                sentiment REAL DEFAULT 0.0,
-                media_path TEXT NOT NULL,
-                media_type TEXT NOT NULL CHECK (media_type IN ('image', 'audio')),
-                person TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create media_files table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS media_files (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                memory_id INTEGER NOT NULL,
-                filename TEXT NOT NULL,
-                original_filename TEXT NOT NULL,
-                file_size INTEGER,
-                mime_type TEXT,
-                file_path TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (memory_id) REFERENCES memories (id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create FTS5 virtual table for full-text search
-        # FTS5 is a full-text search extension for SQLite
-        cursor.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
-                title,
-                text,
-                person,
-                content='memories',
-                content_rowid='id'
-            )
-        """)
-        
-        # Create triggers to keep FTS5 table in sync with memories table
-        # These triggers automatically update the search index when memories are added/updated/deleted
-        
-        # Trigger for INSERT
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
-                INSERT INTO memories_fts(rowid, title, text, person) 
-                VALUES (new.id, new.title, new.text, new.person);
-            END
-        """)
-        
-        # Trigger for UPDATE
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE ON memories BEGIN
-                UPDATE memories_fts SET 
-                    title = new.title,
-                    text = new.text,
-                    person = new.person
-                WHERE rowid = new.id;
-            END
-        """)
-        
-        # Trigger for DELETE
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
-                DELETE FROM memories_fts WHERE rowid = old.id;
-            END
-        """)
-        
-        # Create indexes for better performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_media_type ON memories(media_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_sentiment ON memories(sentiment)")
-        
-        conn.commit()
-        conn.close()
+        # Run the whole schema setup and migration as one transaction, so a
+        # crash partway through (e.g. after recreating memories_fts but before
+        # the rebuild) rolls back and the migration runs again on next start
+        with write_transaction() as cursor:
+            # Create memories table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS memories (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    text TEXT,
+                    date TEXT,
+                    location TEXT,
+                    sentiment REAL DEFAULT 0.0,
+                    media_path TEXT NOT NULL,
+                    media_type TEXT NOT NULL CHECK (media_type IN ('image', 'audio')),
+                    person TEXT,
+                    status TEXT NOT NULL DEFAULT 'done' CHECK (status IN ('pending', 'done', 'failed')),
+                    claimed_by TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Older databases were created before the processing status column
+            columns = [row['name'] for row in cursor.execute("PRAGMA table_info(memories)")]
+            if 'status' not in columns:
+                cursor.execute("""
+                    ALTER TABLE memories ADD COLUMN
+                    status TEXT NOT NULL DEFAULT 'done' CHECK (status IN ('pending', 'done', 'failed'))
+                """)
+            # ...and before pending uploads recorded the worker processing them
+            if 'claimed_by' not in columns:
+                cursor.execute("ALTER TABLE memories ADD COLUMN claimed_by TEXT")
+            
+            # Server processes that are alive, so pending uploads owned by a
+            # process that died can be told apart from ones still in progress
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS workers (
+                    id TEXT PRIMARY KEY,
+                    heartbeat_at TEXT NOT NULL
+                )
+            """)
+            
+            # Create media_files table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS media_files (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    memory_id INTEGER NOT NULL,
+                    filename TEXT NOT NULL,
+                    original_filename TEXT NOT NULL,
+                    file_size INTEGER,
+                    mime_type TEXT,
+                    file_path TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (memory_id) REFERENCES memories (id) ON DELETE CASCADE
+                )
+            """)
+            
+            # Create FTS5 virtual table for full-text search
+            # FTS5 is a full-text search extension for SQLite
+            # - porter: stemming, so "running" matches "run"
+            # - remove_diacritics 2: "cafe" matches "café"
+            # - prefix: extra indexes for 2-4 character prefixes, so typeahead
+            #   queries like "gra*" don't have to scan the whole term list
+            
+            # Indexes created by older versions used the default tokenizer
+            rebuild_fts = False
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts'")
+            row = cursor.fetchone()
+            if row and 'porter' not in row['sql']:
+                cursor.execute("DROP TABLE memories_fts")
+                rebuild_fts = True
+            
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                    title,
+                    text,
+                    person,
+                    content='memories',
+                    content_rowid='id',
+                    tokenize='porter unicode61 remove_diacritics 2',
+                    prefix='2 3 4'
+                )
+            """)
+            
+            # Create triggers to keep FTS5 table in sync with memories table
+            # These triggers automatically update the search index when memories are added/updated/deleted
+            # memories_fts is an external-content table, so old rows must be removed
+            # with the special 'delete' command (a plain UPDATE/DELETE on the FTS
+            # table reads the already-changed content row and corrupts the index).
+            
+            # Replace the triggers created by older versions and rebuild the index
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'memories_fts_update'")
+            row = cursor.fetchone()
+            if row and "'delete'" not in row['sql']:
+                cursor.execute("DROP TRIGGER memories_fts_update")
+                cursor.execute("DROP TRIGGER IF EXISTS memories_fts_delete")
+                rebuild_fts = True
+            
+            # Re-index existing memories after either migration
+            if rebuild_fts:
+                cursor.execute("INSERT INTO memories_fts(memories_fts) VALUES('rebuild')")
+            
+            # Trigger for INSERT
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+                    INSERT INTO memories_fts(rowid, title, text, person) 
+                    VALUES (new.id, new.title, new.text, new.person);
+                END
+            """)
+            
+            # Trigger for UPDATE
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE ON memories BEGIN
+                    INSERT INTO memories_fts(memories_fts, rowid, title, text, person) 
+                    VALUES ('delete', old.id, old.title, old.text, old.person);
+                    INSERT INTO memories_fts(rowid, title, text, person) 
+                    VALUES (new.id, new.title, new.text, new.person);
+                END
+            """)
+            
+            # Trigger for DELETE
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+                    INSERT INTO memories_fts(memories_fts, rowid, title, text, person) 
+                    VALUES ('delete', old.id, old.title, old.text, old.person);
+                END
+            """)
+            
+            # Single-row counter bumped on every change to memories, so the
+            # list ETag can tell the list changed (including deletes, which
+            # MAX(updated_at) misses) without a COUNT(*) over the table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS memories_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("INSERT OR IGNORE INTO memories_version (id, version) VALUES (1, 0)")
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS memories_version_{event.lower()} AFTER {event} ON memories BEGIN
+                        UPDATE memories_version SET version = version + 1 WHERE id = 1;
+                    END
+                """)
+            
+            # Create indexes for better performance
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_media_type ON memories(media_type)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_sentiment ON memories(sentiment)")
+            # Lets MAX(updated_at) for the list ETag read the last index entry
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_updated_at ON memories(updated_at)")
+            
+            # The list view already walks idx_memories_created_at, and covering it
+            # would mean copying the text column into an index; drop the unused one
+            cursor.execute("DROP INDEX IF EXISTS idx_memories_list")
         
         print("✅ Database initialized successfully")
         
@@ -130,7 +385,9 @@ def create_memory(
     sentiment: float = 0.0,
     media_path: str = None,
     media_type: str = None,
-    person: str = None
+    person: str = None,
+    status: str = 'done',
+    claimed_by: str = None
 ) -> int:
     """
     Create a new memory record in the database.
@@ -144,24 +401,24 @@ def create_memory(
         media_path: Path to the media file
         media_type: Type of media ('image' or 'audio')
         person: Person associated with the memory
+        status: Processing status ('pending' while OCR/ASR is still running)
+        claimed_by: ID of the worker process that will process it
         
     Returns:
         ID of the created memory
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with write_transaction() as cursor:
+            cursor.execute("""
+                INSERT INTO memories (
+                    title, text, date, location, sentiment, 
+                    media_path, media_type, person, status, claimed_by
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (title, text, date, location, sentiment, media_path, media_type, person, status, claimed_by))
+            
+            memory_id = cursor.lastrowid
         
-        cursor.execute("""
-            INSERT INTO memories (
-                title, text, date, location, sentiment, 
-                media_path, media_type, person
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (title, text, date, location, sentiment, media_path, media_type, person))
-        
-        memory_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        _count_insert()
         
         print(f"✅ Memory created with ID: {memory_id}")
         return memory_id
@@ -189,7 +446,6 @@ def get_memory_by_id(memory_id: int) -> Optional[Dict]:
         """, (memory_id,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return dict(row)
@@ -199,6 +455,150 @@ def get_memory_by_id(memory_id: int) -> Optional[Dict]:
         print(f"❌ Failed to get memory: {str(e)}")
         raise
 
+def get_memories_version() -> Tuple[int, Optional[str]]:
+    """
+    Get the memory list's change counter and latest update time.
+    
+    The counter is bumped by a trigger whenever a memory is created,
+    updated or deleted, so it identifies the current state of the memory
+    list (used for ETags). Both values are single lookups, so this stays
+    O(1) however many memories there are.
+    
+    Returns:
+        Tuple of (change counter, latest updated_at or None if empty)
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT (SELECT version FROM memories_version WHERE id = 1),
+                   (SELECT MAX(updated_at) FROM memories)
+        """)
+        version, last_updated = cursor.fetchone()
+        return version, last_updated
+        
+    except Exception as e:
+        print(f"❌ Failed to get memories version: {str(e)}")
+        raise
+
+def get_memory_status(memory_id: int) -> Optional[str]:
+    """
+    Get the processing status of a memory.
+    
+    Args:
+        memory_id: ID of the memory
+        
+    Returns:
+        'pending', 'done' or 'failed', or None if the memory doesn't exist
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT status FROM memories WHERE id = ?", (memory_id,))
+        row = cursor.fetchone()
+        
+        return row['status'] if row else None
+        
+    except Exception as e:
+        print(f"❌ Failed to get memory status: {str(e)}")
+        raise
+
+def heartbeat_worker(worker_id: str):
+    """
+    Record that a server process is alive (registering it on first call).
+    
+    Args:
+        worker_id: Unique ID of the server process
+    """
+    try:
+        with write_transaction() as cursor:
+            cursor.execute("""
+                INSERT OR REPLACE INTO workers (id, heartbeat_at)
+                VALUES (?, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+            """, (worker_id,))
+        
+    except Exception as e:
+        print(f"❌ Failed to record worker heartbeat: {str(e)}")
+        raise
+
+def unregister_worker(worker_id: str):
+    """
+    Remove a server process that is shutting down cleanly.
+    
+    Args:
+        worker_id: Unique ID of the server process
+    """
+    try:
+        with write_transaction() as cursor:
+            cursor.execute("DELETE FROM workers WHERE id = ?", (worker_id,))
+        
+    except Exception as e:
+        print(f"❌ Failed to unregister worker: {str(e)}")
+        raise
+
+def claim_pending_memories(worker_id: str, stale_after_seconds: int) -> List[Dict]:
+    """
+    Claim memories left 'pending' by a server process that stopped mid-job.
+    
+    The upload pipeline's queue only lives in memory, so jobs queued or
+    running when a process died are never finished. Workers whose last
+    heartbeat is older than `stale_after_seconds` are treated as dead, and
+    pending memories owned by no live worker are handed to `worker_id`.
+    Memories a live sibling is still processing are left alone.
+    
+    Args:
+        worker_id: Unique ID of the claiming server process
+        stale_after_seconds: Heartbeat age after which a worker counts as dead
+        
+    Returns:
+        List of dicts with id, media_path and media_type
+    """
+    try:
+        with write_transaction() as cursor:
+            cursor.execute("""
+                DELETE FROM workers
+                WHERE heartbeat_at < strftime('%Y-%m-%d %H:%M:%f', 'now', ?)
+            """, (f"-{stale_after_seconds} seconds",))
+            
+            cursor.execute("""
+                SELECT id, media_path, media_type FROM memories
+                WHERE status = 'pending'
+                  AND (claimed_by IS NULL OR claimed_by NOT IN (SELECT id FROM workers))
+            """)
+            memories = list(iter_dicts(cursor))
+            
+            cursor.executemany(
+                "UPDATE memories SET claimed_by = ? WHERE id = ?",
+                [(worker_id, memory['id']) for memory in memories]
+            )
+        
+        return memories
+        
+    except Exception as e:
+        print(f"❌ Failed to claim pending memories: {str(e)}")
+        raise
+
+def _fts_escape(query: str) -> str:
+    """
+    Turn free-form user input into a safe FTS5 prefix query.
+    
+    Every word is quoted, so characters like '-', '"' or ':' can't cause
+    FTS5 syntax errors, and suffixed with * so partially typed words match
+    (served by the prefix indexes). Words are implicitly AND-ed.
+    
+    Example: 'hello-world gra' -> '"hello"* "world"* "gra"*'
+    
+    Args:
+        query: Raw search string
+        
+    Returns:
+        FTS5 MATCH expression, or "" if the query has no words
+    """
+    tokens = re.findall(r"\w+", query, flags=re.UNICODE)
+    return " ".join(f'"{token}"*' for token in tokens)
+
 def search_memories(query: str, limit: int = 20) -> List[Dict]:
     """
     Search memories using full-text search.
@@ -208,6 +608,9 @@ def search_memories(query: str, limit: int = 20) -> List[Dict]:
     - Extracted text content
     - Person names
     
+    The query is treated as plain words (see _fts_escape), each matched as
+    a prefix; FTS5 operators in user input are not interpreted.
+    
     Args:
         query: Search query string
         limit: Maximum number of results to return
@@ -216,50 +619,17 @@ def search_memories(query: str, limit: int = 20) -> List[Dict]:
         List of matching memories with snippets
     """
     try:
+        match_query = _fts_escape(query)
+        if not match_query:
+            return []
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Use FTS5 to search and get snippets
-        # snippet() function returns highlighted text with search terms
-        cursor.execute("""
-            SELECT 
-                m.id,
-                m.title,
-                m.date,
-                m.sentiment,
-                m.media_type,
-                m.media_path,
-                snippet(memories_fts, 1, '<mark>', '</mark>', '...', 32) as title_snippet,
-                snippet(memories_fts, 2, '<mark>', '</mark>', '...', 64) as text_snippet
-            FROM memories_fts
-            JOIN memories m ON memories_fts.rowid = m.id
-            WHERE memories_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-        """, (query, limit))
-        
-        results = []
-        for row in cursor.fetchall():
-            # Combine snippets for display
-            snippet_parts = []
-            if row['title_snippet']:
-                snippet_parts.append(f"Title: {row['title_snippet']}")
-            if row['text_snippet']:
-                snippet_parts.append(f"Text: {row['text_snippet']}")
-            
-            snippet = " | ".join(snippet_parts) if snippet_parts else row['title']
-            
-            results.append({
-                'id': row['id'],
-                'title': row['title'],
-                'snippet': snippet,
-                'date': row['date'],
-                'sentiment': row['sentiment'],
-                'media_type': row['media_type'],
-                'media_path': row['media_path']
-            })
+        cursor.execute(SEARCH_MEMORIES_SQL, (match_query, limit))
+        
+        results = list(iter_dicts(cursor))
         
-        conn.close()
         print(f"✅ Found {len(results)} search results for query: '{query}'")
         return results
         
@@ -267,31 +637,74 @@ def search_memories(query: str, limit: int = 20) -> List[Dict]:
         print(f"❌ Search failed: {str(e)}")
         raise
 
-def get_all_memories(limit: int = 20, offset: int = 0) -> List[Dict]:
+def encode_cursor(created_at: str, memory_id: int) -> str:
+    """
+    Encode the position of a memory in the list as an opaque page cursor.
+    
+    Args:
+        created_at: created_at of the last memory on the page
+        memory_id: ID of the last memory on the page
+        
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{created_at}|{memory_id}".encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a page cursor created by encode_cursor().
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        Tuple of (created_at, memory_id)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, memory_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit('|', 1)
+        return created_at, int(memory_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+def get_all_memories(limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
     """
-    Get all memories with pagination.
+    Get all memories with pagination, newest first.
+    
+    Only the first 240 characters of `text` are returned; use
+    get_memory_by_id() for the full text.
     
     Args:
         limit: Maximum number of memories to return
-        offset: Number of memories to skip
+        cursor: next_cursor from the previous page (None for the first page)
         
     Returns:
-        List of memory dictionaries
+        Tuple of (list of memory dictionaries, cursor for the next page or
+        None when this is the last page)
+        
+    Raises:
+        ValueError: If the cursor is malformed
     """
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
+        db_cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT * FROM memories 
-            ORDER BY created_at DESC 
-            LIMIT ? OFFSET ?
-        """, (limit, offset))
+        if cursor:
+            created_at, memory_id = decode_cursor(cursor)
+            db_cursor.execute(LIST_MEMORIES_AFTER_SQL, (created_at, memory_id, limit))
+        else:
+            db_cursor.execute(LIST_MEMORIES_SQL, (limit,))
         
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        results = list(iter_dicts(db_cursor))
         
-        return results
+        next_cursor = None
+        if results and len(results) == limit:
+            last = results[-1]
+            next_cursor = encode_cursor(last['created_at'], last['id'])
+        
+        return results, next_cursor
         
     except Exception as e:
         print(f"❌ Failed to get memories: {str(e)}")
@@ -309,31 +722,27 @@ def update_memory(memory_id: int, **kwargs) -> bool:
         True if update was successful, False otherwise
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Build dynamic UPDATE query
         set_clauses = []
         values = []
         
         for key, value in kwargs.items():
-            if key in ['title', 'text', 'date', 'location', 'sentiment', 'person']:
+            if key in ['title', 'text', 'date', 'location', 'sentiment', 'person', 'status']:
                 set_clauses.append(f"{key} = ?")
                 values.append(value)
         
         if not set_clauses:
             return False
         
-        # Add updated_at timestamp
-        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+        # Add updated_at timestamp (with milliseconds, so ETags change
+        # even when a memory is updated twice within the same second)
+        set_clauses.append("updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now')")
         values.append(memory_id)
         
         query = f"UPDATE memories SET {', '.join(set_clauses)} WHERE id = ?"
-        cursor.execute(query, values)
-        
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with write_transaction() as cursor:
+            cursor.execute(query, values)
+            success = cursor.rowcount > 0
         
         if success:
             print(f"✅ Memory {memory_id} updated successfully")
@@ -357,23 +766,18 @@ def delete_memory(memory_id: int) -> bool:
         True if deletion was successful, False otherwise
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get memory info before deletion
-        cursor.execute("SELECT media_path FROM memories WHERE id = ?", (memory_id,))
-        row = cursor.fetchone()
-        
-        if not row:
-            conn.close()
-            return False
-        
-        # Delete the memory (triggers will handle FTS5 cleanup)
-        cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-        
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with write_transaction() as cursor:
+            # Get memory info before deletion
+            cursor.execute("SELECT media_path FROM memories WHERE id = ?", (memory_id,))
+            row = cursor.fetchone()
+            
+            if not row:
+                return False
+            
+            # Delete the memory (triggers will handle FTS5 cleanup)
+            cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+            
+            success = cursor.rowcount > 0
         
         if success:
             # Try to delete the associated media file
@@ -421,8 +825,6 @@ def get_database_stats() -> Dict:
         # Get database file size
         db_size = os.path.getsize(DATABASE_PATH) if os.path.exists(DATABASE_PATH) else 0
         
-        conn.close()
-        
         return {
             'total_memories': total_memories,
             'by_type': by_type,
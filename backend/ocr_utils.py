@@ -1,63 +1,242 @@
 """
 OCR (Optical Character Recognition) utilities for MemoriaVault.
-Handles image preprocessing and text extraction using Tesseract.
+Handles image preprocessing and text extraction using Tesseract,
+or EasyOCR / PaddleOCR when a GPU is available.
 """
 
+import os
+
+# Run each Tesseract call single-threaded: for a typical photo OpenMP's thread
+# setup costs more than it saves, and OCR already runs in several worker
+# processes. Scale OCR with CPU_WORKERS / UVICORN_WORKERS, not OpenMP threads.
+# Set before cv2/tesserocr load so in-process OpenMP runtimes see it too;
+# tesseract subprocesses inherit it from os.environ.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import cv2
 import pytesseract
 import exifread
+import imagesize
 from PIL import Image
 import numpy as np
-from typing import Dict, Optional
-import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+import io
+import logging
+import mmap
+import re
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# OCR engine: tesseract (CPU), easyocr or paddle (both use the GPU if present)
+OCR_BACKEND = os.environ.get("OCR_BACKEND", "tesseract").lower()
+
+# GPU OCR engines are expensive to create, so one instance is shared
+_easyocr_reader = None
+_paddle_ocr = None
+_ocr_engine_lock = threading.Lock()
+
+# Configure Tesseract for better accuracy
+# PSM 6: Assume a single uniform block of text
+# OEM 3: Default OCR Engine Mode
+TESSERACT_CONFIG = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}"\' '
+TESSERACT_WHITELIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}\"'"
+
+# Thresholding method: "otsu" picks one global threshold from the histogram
+# in a single pass; "adaptive" compares each pixel with its 11x11 neighborhood,
+# which copes better with uneven lighting but reads every pixel many times
+OCR_THRESHOLD = os.environ.get("OCR_THRESHOLD", "otsu").lower()
+
+# Optional morphological close after thresholding, to join broken strokes
+# (OCR_MORPH_KERNEL=3 for a 3x3 close; 0 or 1 disables it). The kernel is a
+# rectangle so OpenCV runs it as separable row and column passes on its
+# SIMD path instead of a full KxK window per pixel.
+OCR_MORPH_KERNEL = int(os.environ.get("OCR_MORPH_KERNEL", "0"))
+_morph_kernel = (
+    cv2.getStructuringElement(cv2.MORPH_RECT, (OCR_MORPH_KERNEL, OCR_MORPH_KERNEL))
+    if OCR_MORPH_KERNEL > 1 else None
+)
 
-def preprocess_image(image_path: str) -> np.ndarray:
+# Any run of whitespace (spaces, tabs, line breaks) in OCR output
+_WS_RE = re.compile(r'\s+')
+
+# Images are downscaled so their longest edge is at most this many pixels
+# before OCR (INTER_AREA keeps text strokes smooth when shrinking)
+OCR_MAX_EDGE = 2000
+
+# Leading bytes identifying the image formats get_image_info reports
+_IMAGE_FORMAT_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF8", "GIF"),
+    (b"II*\x00", "TIFF"),
+    (b"MM\x00*", "TIFF"),
+    (b"BM", "BMP"),
+)
+
+# Whether the tesseract binary is installed (None until first checked)
+_TESSERACT_OK = None
+
+# tesserocr keeps one Tesseract engine loaded in-process for batches
+# (optional dependency; None until first used, False if not installed)
+_tess_api = None
+_tess_api_lock = threading.Lock()
+
+def _check_tesseract() -> bool:
+    """
+    Check once per process whether Tesseract is installed.
+    
+    get_tesseract_version() starts a tesseract subprocess, so the result
+    is cached instead of paying for that on every image.
+    """
+    global _TESSERACT_OK
+    
+    if _TESSERACT_OK is None:
+        try:
+            pytesseract.get_tesseract_version()
+            _TESSERACT_OK = True
+        except Exception:
+            logger.warning(
+                "⚠️ Tesseract not found. Please install Tesseract OCR.\n"
+                "   Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki\n"
+                "   macOS: brew install tesseract\n"
+                "   Ubuntu: sudo apt-get install tesseract-ocr"
+            )
+            _TESSERACT_OK = False
+    
+    return _TESSERACT_OK
+
+@dataclass
+class ImageBundle:
+    """
+    An image file read and decoded once, shared by OCR, EXIF and info.
+    
+    Attributes:
+        path: Path the image was read from
+        raw_bytes: File contents
+        bgr: Decoded pixels (OpenCV BGR order), or None if decoding failed
+        pil: PIL handle on raw_bytes (header only until pixels are accessed)
+        exif: EXIF tags from exifread
+    """
+    path: str
+    raw_bytes: bytes
+    bgr: Optional[np.ndarray]
+    pil: Optional[Image.Image]
+    exif: Dict
+
+def load_image(image_path: str) -> ImageBundle:
+    """
+    Read an image file once and decode it for all downstream consumers.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        ImageBundle that preprocess_image, extract_text_from_image,
+        extract_exif_data and get_image_info accept instead of a path
+    """
+    with open(image_path, 'rb') as f:
+        raw_bytes = f.read()
+    
+    bgr = cv2.imdecode(np.frombuffer(raw_bytes, np.uint8), cv2.IMREAD_COLOR)
+    
+    try:
+        pil = Image.open(io.BytesIO(raw_bytes))
+    except Exception:
+        pil = None
+    
+    try:
+        exif = exifread.process_file(io.BytesIO(raw_bytes), details=False)
+    except Exception:
+        exif = {}
+    
+    return ImageBundle(path=image_path, raw_bytes=raw_bytes, bgr=bgr, pil=pil, exif=exif)
+
+def _image_name(image: Union[str, ImageBundle, np.ndarray]) -> str:
+    """Path of an image given as a path or an ImageBundle, for log messages."""
+    if isinstance(image, np.ndarray):
+        return "<in-memory image>"
+    return image.path if isinstance(image, ImageBundle) else image
+
+def preprocess_image(image: Union[str, ImageBundle, np.ndarray]) -> np.ndarray:
     """
     Preprocess an image to improve OCR accuracy.
     
     This function:
-    1. Converts the image to grayscale (removes color information)
-    2. Applies noise reduction to clean up the image
-    3. Enhances contrast to make text more readable
-    4. Applies thresholding to create a black and white image
+    1. Downscales images whose longest edge is over OCR_MAX_EDGE pixels
+    2. Converts the image to grayscale (removes color information)
+    3. Applies noise reduction to clean up the image
+    4. Applies Otsu (or adaptive, see OCR_THRESHOLD) thresholding to create a black and white image
+    5. Optionally closes gaps in strokes (OCR_MORPH_KERNEL)
     
     Args:
-        image_path: Path to the input image file
+        image: Path to the input image file, an ImageBundle from load_image(),
+               or an already decoded BGR (or grayscale) array
         
     Returns:
         Preprocessed image as a numpy array
+        
+    Raises:
+        ValueError: If the image file can't be read or decoded
     """
+    # Decode once (unless already decoded); the fallback below reuses it
+    if isinstance(image, np.ndarray):
+        bgr = image
+    elif isinstance(image, ImageBundle):
+        bgr = image.bgr
+    else:
+        bgr = cv2.imread(image)
+    if bgr is None:
+        raise ValueError(f"Could not read image from {_image_name(image)}")
+    
     try:
-        # Read the image
-        image = cv2.imread(image_path)
-        if image is None:
-            raise ValueError(f"Could not read image from {image_path}")
+        # Shrink large photos first: Tesseract reads document-sized text best,
+        # and every following step costs time proportional to the pixel count
+        scale = min(1.0, OCR_MAX_EDGE / max(bgr.shape[:2]))
+        if scale < 1.0:
+            bgr = cv2.resize(bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        # Two single-channel buffers are reused for every step (via dst=)
+        # instead of allocating a new full-size image per step
+        gray = np.empty(bgr.shape[:2], np.uint8)
+        buf = np.empty(bgr.shape[:2], np.uint8)
         
         # Convert to grayscale (removes color, keeps only brightness)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if bgr.ndim == 2:
+            np.copyto(gray, bgr)
+        else:
+            cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY, dst=gray)
         
         # Apply Gaussian blur to reduce noise (smooths out small imperfections)
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
         
-        # Apply adaptive thresholding (converts to black and white)
+        # Apply thresholding (converts to black and white)
         # This helps separate text from background
-        thresh = cv2.adaptiveThreshold(
-            blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-        )
+        if OCR_THRESHOLD == "adaptive":
+            cv2.adaptiveThreshold(
+                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2, dst=buf
+            )
+        else:
+            cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=buf)
         
-        # Apply morphological operations to clean up the image
-        # This removes small noise and connects broken text
-        kernel = np.ones((1, 1), np.uint8)
-        cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+        # Optionally close small gaps in the text strokes (in place)
+        if _morph_kernel is not None:
+            cv2.morphologyEx(buf, cv2.MORPH_CLOSE, _morph_kernel, dst=buf)
         
-        return cleaned
+        return buf
         
     except Exception as e:
-        print(f"❌ Image preprocessing failed: {str(e)}")
-        # Return original image if preprocessing fails
-        return cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        logger.error("❌ Image preprocessing failed: %s", e)
+        # Return the original image in grayscale, from the pixels already in memory
+        if bgr.ndim == 2:
+            return bgr
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
 
-def extract_text_from_image(image_path: str) -> str:
+def extract_text_from_image(image: Union[str, ImageBundle]) -> str:
     """
     Extract text from an image using OCR (Optical Character Recognition).
     
@@ -67,47 +246,222 @@ def extract_text_from_image(image_path: str) -> str:
     3. Cleans up the extracted text
     
     Args:
-        image_path: Path to the image file
+        image: Path to the image file, or an ImageBundle from load_image()
         
     Returns:
         Extracted text as a string
     """
     try:
-        print(f"🔍 Extracting text from: {image_path}")
+        logger.debug("🔍 Extracting text from: %s", _image_name(image))
         
         # Check if Tesseract is available
-        try:
-            pytesseract.get_tesseract_version()
-        except Exception:
-            print("⚠️ Tesseract not found. Please install Tesseract OCR.")
-            print("   Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki")
-            print("   macOS: brew install tesseract")
-            print("   Ubuntu: sudo apt-get install tesseract-ocr")
+        if not _check_tesseract():
             return "OCR not available - Tesseract not installed"
         
         # Preprocess the image
-        processed_image = preprocess_image(image_path)
-        
-        # Configure Tesseract for better accuracy
-        # PSM 6: Assume a single uniform block of text
-        # OEM 3: Default OCR Engine Mode
-        custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}"\' '
+        processed_image = preprocess_image(image)
         
         # Extract text using Tesseract
         extracted_text = pytesseract.image_to_string(
             processed_image, 
-            config=custom_config,
+            config=TESSERACT_CONFIG,
             lang='eng'  # English language
         )
         
         # Clean up the extracted text
         cleaned_text = clean_extracted_text(extracted_text)
         
-        print(f"✅ Extracted {len(cleaned_text)} characters of text")
+        logger.debug("✅ Extracted %d characters of text", len(cleaned_text))
+        return cleaned_text
+        
+    except Exception as e:
+        logger.error("❌ OCR extraction failed: %s", e)
+        return f"Text extraction failed: {str(e)}"
+
+def extract_text_parallel(image_paths: List[str], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Run extract_text_from_image on several images at once.
+    
+    Each call spends its time waiting on a tesseract subprocess, which
+    doesn't hold the GIL, so threads are enough to keep all cores busy.
+    With OMP_THREAD_LIMIT=1 each subprocess uses one core.
+    
+    Args:
+        image_paths: Paths to the image files
+        max_workers: Maximum number of concurrent tesseract processes
+                     (default: number of CPUs)
+        
+    Returns:
+        Extracted text for each image, in the same order
+    """
+    if not image_paths:
+        return []
+    
+    max_workers = min(len(image_paths), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(extract_text_from_image, image_paths))
+
+def _get_tess_api():
+    """
+    Get the shared tesserocr engine, creating it on first use.
+    
+    Returns:
+        PyTessBaseAPI instance, or None if tesserocr is not installed
+    """
+    global _tess_api
+    
+    if _tess_api is None:
+        try:
+            from tesserocr import PyTessBaseAPI, PSM
+            
+            _tess_api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK)
+            _tess_api.SetVariable("tessedit_char_whitelist", TESSERACT_WHITELIST)
+            logger.info("✅ tesserocr engine loaded")
+        except Exception:
+            _tess_api = False
+    
+    return _tess_api or None
+
+def _ocr_batch_tesserocr(api, image_paths: List[str]) -> List[str]:
+    """Run the already loaded tesserocr engine over each image in turn."""
+    texts = []
+    for image_path in image_paths:
+        processed_image = preprocess_image(image_path)
+        api.SetImage(Image.fromarray(processed_image))
+        texts.append(api.GetUTF8Text())
+    return texts
+
+def _ocr_batch_list_file(image_paths: List[str]) -> List[str]:
+    """
+    Run a single tesseract process over all images.
+    
+    The preprocessed images are written to a temporary directory and
+    tesseract is given a text file listing them. It prints the text of
+    each image followed by a form feed, which is used to split the output.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        list_path = os.path.join(tmp_dir, "images.txt")
+        with open(list_path, "w") as list_file:
+            for i, image_path in enumerate(image_paths):
+                page_path = os.path.join(tmp_dir, f"{i}.png")
+                cv2.imwrite(page_path, preprocess_image(image_path))
+                list_file.write(page_path + "\n")
+        
+        output = pytesseract.image_to_string(list_path, config=TESSERACT_CONFIG, lang='eng')
+    
+    pages = output.split('\f')
+    if len(pages) < len(image_paths):
+        raise ValueError(f"Expected {len(image_paths)} pages from tesseract, got {len(pages)}")
+    return pages[:len(image_paths)]
+
+def extract_text_batch(image_paths: List[str]) -> List[str]:
+    """
+    Extract text from several images with a single Tesseract engine.
+    
+    Starting Tesseract costs more than recognizing a typical photo, so
+    a batch reuses one engine: tesserocr's in-process API when it is
+    installed, otherwise one tesseract run over a list of images.
+    Falls back to extract_text_parallel if the batch fails.
+    
+    Args:
+        image_paths: Paths to the image files
+        
+    Returns:
+        Extracted text for each image, in the same order
+    """
+    if not image_paths:
+        return []
+    
+    try:
+        logger.debug("🔍 Extracting text from %d images", len(image_paths))
+        
+        with _tess_api_lock:
+            api = _get_tess_api()
+            if api is not None:
+                texts = _ocr_batch_tesserocr(api, image_paths)
+        
+        if api is None:
+            if not _check_tesseract():
+                return ["OCR not available - Tesseract not installed"] * len(image_paths)
+            texts = _ocr_batch_list_file(image_paths)
+        
+        cleaned_texts = [clean_extracted_text(text) for text in texts]
+        
+        logger.debug("✅ Extracted text from %d images", len(cleaned_texts))
+        return cleaned_texts
+        
+    except Exception as e:
+        logger.warning("⚠️ Batch OCR failed, processing images separately: %s", e)
+        return extract_text_parallel(image_paths)
+
+def load_ocr_backend(backend: str = OCR_BACKEND):
+    """
+    Create the OCR engine for the given backend.
+    
+    EasyOCR and PaddleOCR load their models here (onto the GPU if one is
+    available). Tesseract runs as a subprocess per image and needs no setup.
+    Both GPU libraries are optional dependencies and only imported when selected.
+    
+    Args:
+        backend: 'tesseract', 'easyocr' or 'paddle'
+    """
+    global _easyocr_reader, _paddle_ocr
+    
+    with _ocr_engine_lock:
+        if backend == "easyocr" and _easyocr_reader is None:
+            import easyocr
+            import torch
+            
+            gpu = torch.cuda.is_available()
+            logger.info("🔄 Loading EasyOCR reader (gpu=%s)...", gpu)
+            _easyocr_reader = easyocr.Reader(['en'], gpu=gpu)
+            logger.info("✅ EasyOCR reader loaded")
+            
+        elif backend == "paddle" and _paddle_ocr is None:
+            import paddle
+            from paddleocr import PaddleOCR
+            
+            gpu = paddle.device.is_compiled_with_cuda()
+            logger.info("🔄 Loading PaddleOCR (gpu=%s)...", gpu)
+            _paddle_ocr = PaddleOCR(use_angle_cls=False, lang='en', use_gpu=gpu, show_log=False)
+            logger.info("✅ PaddleOCR loaded")
+            
+        elif backend not in ("tesseract", "easyocr", "paddle"):
+            raise ValueError(f"Unknown OCR backend: {backend}")
+
+def extract_text(image_path: str, backend: str = OCR_BACKEND) -> str:
+    """
+    Extract text from an image with the configured OCR backend.
+    
+    Args:
+        image_path: Path to the image file
+        backend: 'tesseract', 'easyocr' or 'paddle'
+        
+    Returns:
+        Extracted text as a string
+    """
+    if backend == "tesseract":
+        return extract_text_from_image(image_path)
+    
+    try:
+        logger.debug("🔍 Extracting text with %s from: %s", backend, image_path)
+        load_ocr_backend(backend)
+        
+        # The shared reader is not safe to call from several threads at once
+        with _ocr_engine_lock:
+            if backend == "easyocr":
+                lines = _easyocr_reader.readtext(image_path, detail=0, paragraph=True)
+            else:
+                result = _paddle_ocr.ocr(image_path, cls=False)
+                lines = [line[1][0] for page in result if page for line in page]
+        
+        cleaned_text = clean_extracted_text('\n'.join(lines))
+        
+        logger.debug("✅ Extracted %d characters of text", len(cleaned_text))
         return cleaned_text
         
     except Exception as e:
-        print(f"❌ OCR extraction failed: {str(e)}")
+        logger.error("❌ OCR extraction failed: %s", e)
         return f"Text extraction failed: {str(e)}"
 
 def clean_extracted_text(text: str) -> str:
@@ -123,20 +477,10 @@ def clean_extracted_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace and normalize line breaks
-    lines = [line.strip() for line in text.split('\n')]
-    lines = [line for line in lines if line]  # Remove empty lines
-    
-    # Join lines with single spaces
-    cleaned = ' '.join(lines)
-    
-    # Remove multiple consecutive spaces
-    while '  ' in cleaned:
-        cleaned = cleaned.replace('  ', ' ')
-    
-    return cleaned.strip()
+    # Collapse whitespace runs and line breaks into single spaces in one pass
+    return _WS_RE.sub(' ', text).strip()
 
-def extract_exif_data(image_path: str) -> Dict[str, Optional[str]]:
+def extract_exif_data(image: Union[str, ImageBundle]) -> Dict[str, Optional[str]]:
     """
     Extract EXIF metadata from an image file.
     
@@ -147,16 +491,21 @@ def extract_exif_data(image_path: str) -> Dict[str, Optional[str]]:
     - Camera make and model
     
     Args:
-        image_path: Path to the image file
+        image: Path to the image file, or an ImageBundle from load_image()
         
     Returns:
         Dictionary containing extracted metadata
     """
     try:
-        print(f"📸 Extracting EXIF data from: {image_path}")
+        logger.debug("📸 Extracting EXIF data from: %s", _image_name(image))
         
-        with open(image_path, 'rb') as f:
-            tags = exifread.process_file(f, details=False)
+        if isinstance(image, ImageBundle):
+            tags = image.exif
+        else:
+            # exifread seeks around the file a lot; a memory map turns those
+            # seeks and small reads into plain memory access
+            with open(image, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tags = exifread.process_file(mm, details=False)
         
         exif_data = {
             'date': None,
@@ -166,21 +515,15 @@ def extract_exif_data(image_path: str) -> Dict[str, Optional[str]]:
         }
         
         # Extract date information
-        if 'EXIF DateTimeOriginal' in tags:
-            date_str = str(tags['EXIF DateTimeOriginal'])
+        date_tag = tags.get('EXIF DateTimeOriginal') or tags.get('Image DateTime')
+        if date_tag is not None:
+            date_str = str(date_tag)
             # Convert from "YYYY:MM:DD HH:MM:SS" to "YYYY-MM-DD"
             try:
-                date_part = date_str.split(' ')[0]
-                exif_data['date'] = date_part.replace(':', '-')
-            except:
-                exif_data['date'] = date_str
-        elif 'Image DateTime' in tags:
-            date_str = str(tags['Image DateTime'])
-            try:
-                date_part = date_str.split(' ')[0]
-                exif_data['date'] = date_part.replace(':', '-')
-            except:
-                exif_data['date'] = date_str
+                exif_data['date'] = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S").date().isoformat()
+            except ValueError:
+                # Non-standard value (e.g. date only); keep the date part
+                exif_data['date'] = date_str.split(' ')[0].replace(':', '-')
         
         # Extract camera information
         if 'Image Make' in tags:
@@ -197,11 +540,11 @@ def extract_exif_data(image_path: str) -> Dict[str, Optional[str]]:
             except:
                 pass
         
-        print(f"✅ Extracted EXIF data: {exif_data}")
+        logger.debug("✅ Extracted EXIF data: %s", exif_data)
         return exif_data
         
     except Exception as e:
-        print(f"❌ EXIF extraction failed: {str(e)}")
+        logger.error("❌ EXIF extraction failed: %s", e)
         return {
             'date': None,
             'location': None,
@@ -209,31 +552,75 @@ def extract_exif_data(image_path: str) -> Dict[str, Optional[str]]:
             'camera_model': None
         }
 
-def get_image_info(image_path: str) -> Dict[str, any]:
+def get_image_info(image: Union[str, ImageBundle]) -> Dict[str, any]:
     """
     Get basic information about an image file.
     
+    For a path only the file header is read: imagesize gets the dimensions
+    and the format comes from the file's magic bytes. PIL is only used for
+    formats imagesize doesn't know.
+    
     Args:
-        image_path: Path to the image file
+        image: Path to the image file, or an ImageBundle from load_image()
         
     Returns:
         Dictionary containing image information
     """
     try:
-        with Image.open(image_path) as img:
+        if isinstance(image, ImageBundle):
+            img = image.pil
             return {
                 'width': img.width,
                 'height': img.height,
                 'format': img.format,
-                'mode': img.mode,
-                'size_bytes': os.path.getsize(image_path)
+                'size_bytes': len(image.raw_bytes)
             }
+        
+        image_path = image
+        width, height = imagesize.get(image_path)
+        if width < 0:
+            with Image.open(image_path) as img:
+                width, height, image_format = img.width, img.height, img.format
+        else:
+            with open(image_path, 'rb') as f:
+                head = f.read(8)
+            image_format = next(
+                (name for magic, name in _IMAGE_FORMAT_SIGNATURES if head.startswith(magic)),
+                None
+            )
+        
+        return {
+            'width': width,
+            'height': height,
+            'format': image_format,
+            'size_bytes': os.path.getsize(image_path)
+        }
     except Exception as e:
-        print(f"❌ Failed to get image info: {str(e)}")
+        logger.error("❌ Failed to get image info: %s", e)
         return {}
 
+def process_image(image_path: str) -> Tuple[str, Dict[str, Optional[str]]]:
+    """
+    Run OCR and EXIF extraction on an image read from disk only once.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        Tuple of (extracted text, EXIF metadata)
+    """
+    try:
+        image = load_image(image_path)
+    except Exception as e:
+        logger.error("❌ Failed to read image: %s", e)
+        return f"Text extraction failed: {str(e)}", extract_exif_data(image_path)
+    
+    return extract_text_from_image(image), extract_exif_data(image)
+
 # Test function for development
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    
     # Test with a sample image
     test_image = "test_image.jpg"
     if os.path.exists(test_image):
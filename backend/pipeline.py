@@ -0,0 +1,174 @@
+"""
+Background processing pipeline for MemoriaVault.
+Runs OCR/ASR, sentiment analysis and database writes for uploads in separate stages.
+"""
+
+import asyncio
+import queue
+import threading
+from typing import Callable, Dict, List, Optional
+
+# Sentinel placed on a stage queue to stop its worker thread
+_STOP = object()
+
+class PipelineStage:
+    """
+    One stage of the upload pipeline.
+
+    Each stage owns one or more worker threads and a bounded queue. A worker
+    takes a job (a dict) off the queue, runs `handler` on it and passes the
+    returned job on to `next_stage`. A full queue blocks the stage feeding
+    it, so a slow stage applies back-pressure instead of buffering without
+    limit.
+
+    With batch_size > 1 a worker drains up to that many waiting jobs at a
+    time and `handler` receives and returns a list of jobs instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable,
+        next_stage: Optional["PipelineStage"] = None,
+        max_queue_size: int = 32,
+        num_workers: int = 1,
+        batch_size: int = 1
+    ):
+        """
+        Args:
+            name: Stage name, used for the thread name and log messages
+            handler: Function that processes a job and returns it for the next stage
+            next_stage: Stage that receives the handler's result (None for the last stage)
+            max_queue_size: Maximum number of jobs waiting in this stage
+            num_workers: Number of threads running the handler concurrently
+            batch_size: Maximum number of jobs passed to the handler at once
+        """
+        self.name = name
+        self.handler = handler
+        self.next_stage = next_stage
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.on_error: Optional[Callable[[Dict, Exception], None]] = None
+        self._threads = [
+            threading.Thread(target=self._run, name=f"pipeline-{name}-{i}", daemon=True)
+            for i in range(num_workers)
+        ]
+
+    def start(self):
+        """Start the worker threads."""
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop the worker threads once the jobs already queued are processed."""
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def put(self, job: Dict):
+        """Add a job to this stage, blocking while the queue is full."""
+        self.queue.put(job)
+
+    def _next_jobs(self) -> List:
+        """Wait for a job, then take up to batch_size - 1 more that are already queued."""
+        jobs = [self.queue.get()]
+        while len(jobs) < self.batch_size and jobs[-1] is not _STOP:
+            try:
+                jobs.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return jobs
+
+    def _run(self):
+        while True:
+            jobs = self._next_jobs()
+            stopping = jobs[-1] is _STOP
+            if stopping:
+                jobs.pop()
+
+            if jobs:
+                self._process(jobs)
+
+            if stopping:
+                break
+
+    def _process(self, jobs: List[Dict]):
+        try:
+            if self.batch_size > 1:
+                results = self.handler(jobs)
+            else:
+                results = [self.handler(jobs[0])]
+        except Exception as e:
+            for job in jobs:
+                print(f"❌ Pipeline stage '{self.name}' failed for memory {job.get('memory_id')}: {str(e)}")
+                if self.on_error:
+                    try:
+                        self.on_error(job, e)
+                    except Exception as handler_error:
+                        print(f"❌ Pipeline error handler failed: {str(handler_error)}")
+            return
+
+        if self.next_stage is not None:
+            for result in results:
+                self.next_stage.put(result)
+
+class AsyncTaskPipeline:
+    """
+    Chain of PipelineStages fed from async request handlers.
+
+    Jobs are routed to an entry stage by their 'kind' (e.g. 'image' goes to
+    OCR, 'audio' goes to ASR) and then follow each stage's next_stage.
+    Stages for different uploads run concurrently.
+    """
+
+    def __init__(
+        self,
+        entry_stages: Dict[str, PipelineStage],
+        on_error: Optional[Callable[[Dict, Exception], None]] = None
+    ):
+        """
+        Args:
+            entry_stages: First stage for each job kind
+            on_error: Called with (job, exception) when any stage fails
+        """
+        self.entry_stages = entry_stages
+
+        # Collect every stage reachable from the entries, upstream first
+        self.stages: List[PipelineStage] = []
+        pending = list(entry_stages.values())
+        while pending:
+            stage = pending.pop(0)
+            if stage in self.stages:
+                continue
+            self.stages.append(stage)
+            if stage.next_stage is not None:
+                pending.append(stage.next_stage)
+
+        for stage in self.stages:
+            stage.on_error = on_error
+
+    def start(self):
+        """Start all stage threads."""
+        for stage in self.stages:
+            stage.start()
+        print(f"✅ Upload pipeline started ({', '.join(s.name for s in self.stages)})")
+
+    def stop(self):
+        """Drain and stop all stages, upstream stages first."""
+        for stage in self.stages:
+            stage.stop()
+
+    async def submit(self, job: Dict):
+        """
+        Queue a job for processing.
+
+        The put runs in the default executor so a full entry queue doesn't
+        block the event loop.
+
+        Args:
+            job: Job dict with at least 'kind' and 'memory_id'
+        """
+        stage = self.entry_stages[job['kind']]
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, stage.put, job)
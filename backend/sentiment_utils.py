@@ -5,12 +5,77 @@ Analyzes the emotional tone of extracted text using TextBlob and VADER.
 
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import logging
 import re
+import threading
+
+logger = logging.getLogger(__name__)
 
 # Initialize VADER sentiment analyzer
 vader_analyzer = SentimentIntensityAnalyzer()
 
+# Text cleaning patterns, compiled once at import
+_WS_RE = re.compile(r'\s+')
+# URLs, email addresses and phone numbers don't contribute to sentiment,
+# so they are removed together in one pass
+_NOISE_RE = re.compile(
+    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+    r'|\S+@\S+'
+    r'|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+)
+# Runs of the same punctuation mark ("!!!", "???", "...")
+_PUNCT_RE = re.compile(r'([!?.])\1+')
+
+# Recently computed (TextBlob, VADER) scores, keyed by a 16-byte blake2b
+# digest of the cleaned text so the cache holds fixed-size keys instead of
+# whole documents. The TextBlob score is None when only VADER was needed.
+SENTIMENT_CACHE_SIZE = 4096
+_sentiment_cache: "OrderedDict[bytes, Tuple[Optional[float], float]]" = OrderedDict()
+_sentiment_cache_lock = threading.Lock()
+
+def _text_digest(text: str) -> bytes:
+    """Hash text into a compact cache key."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def _component_scores(cleaned_text: str, need_textblob: bool = True) -> Tuple[Optional[float], float]:
+    """
+    Get the TextBlob and VADER scores of cleaned text, memoized by its digest.
+    
+    Texts that clean to the same string (repeated receipts, watermarks,
+    re-uploads) are only scored once, and analyze_sentiment,
+    analyze_sentiment_fast and analyze_sentiment_detailed share the results.
+    
+    Args:
+        cleaned_text: Output of clean_text_for_sentiment
+        need_textblob: Compute the TextBlob score too (VADER is always computed)
+        
+    Returns:
+        Tuple of (TextBlob score or None if not needed, VADER score)
+    """
+    key = _text_digest(cleaned_text)
+    with _sentiment_cache_lock:
+        cached = _sentiment_cache.get(key)
+        if cached is not None:
+            _sentiment_cache.move_to_end(key)
+    
+    if cached is not None and (cached[0] is not None or not need_textblob):
+        return cached
+    
+    vader_score = cached[1] if cached is not None else get_vader_sentiment(cleaned_text)
+    textblob_score = get_textblob_sentiment(cleaned_text) if need_textblob else None
+    scores = (textblob_score, vader_score)
+    
+    with _sentiment_cache_lock:
+        _sentiment_cache[key] = scores
+        _sentiment_cache.move_to_end(key)
+        if len(_sentiment_cache) > SENTIMENT_CACHE_SIZE:
+            _sentiment_cache.popitem(last=False)
+    
+    return scores
+
 def analyze_sentiment(text: str) -> float:
     """
     Analyze the sentiment of text and return a score between -1 and 1.
@@ -20,6 +85,7 @@ def analyze_sentiment(text: str) -> float:
     2. VADER: Better for social media text and informal language
     
     The final score is an average of both methods.
+    Results are cached by cleaned text, so re-uploads of the same document are free.
     
     Sentiment scores:
     - 1.0: Very positive (happy, excited, love)
@@ -42,11 +108,8 @@ def analyze_sentiment(text: str) -> float:
         if not cleaned_text:
             return 0.0
         
-        # Get sentiment from TextBlob
-        textblob_score = get_textblob_sentiment(cleaned_text)
-        
-        # Get sentiment from VADER
-        vader_score = get_vader_sentiment(cleaned_text)
+        # Get sentiment from TextBlob and VADER
+        textblob_score, vader_score = _component_scores(cleaned_text)
         
         # Average the two scores for better accuracy
         final_score = (textblob_score + vader_score) / 2
@@ -55,8 +118,54 @@ def analyze_sentiment(text: str) -> float:
         return round(final_score, 2)
         
     except Exception as e:
-        print(f"❌ Sentiment analysis failed: {str(e)}")
+        logger.error("❌ Sentiment analysis failed: %s", e)
+        return 0.0
+
+def analyze_sentiment_fast(text: str) -> float:
+    """
+    Score sentiment with VADER alone.
+    
+    VADER is a dictionary lookup over the words, while TextBlob tokenizes
+    and tags the text first, which dominates analyze_sentiment's cost on
+    long documents. Scores are close to, but not the same as, the
+    TextBlob/VADER average.
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        Sentiment score between -1.0 and 1.0
+    """
+    if not text or not text.strip():
+        return 0.0
+    
+    cleaned_text = clean_text_for_sentiment(text)
+    if not cleaned_text:
         return 0.0
+    
+    _, vader_score = _component_scores(cleaned_text, need_textblob=False)
+    return round(vader_score, 2)
+
+def analyze_sentiment_batch(texts: List[str], fast: bool = False) -> List[float]:
+    """
+    Analyze the sentiment of several texts at once.
+    
+    Used by the upload pipeline to score a batch of jobs in one call.
+    Duplicate texts within the batch are only analyzed once.
+    
+    Args:
+        texts: Texts to analyze
+        fast: Use analyze_sentiment_fast (VADER only) instead of analyze_sentiment
+        
+    Returns:
+        Sentiment scores, in the same order as `texts`
+    """
+    analyze = analyze_sentiment_fast if fast else analyze_sentiment
+    scores = {}
+    for text in texts:
+        if text not in scores:
+            scores[text] = analyze(text)
+    return [scores[text] for text in texts]
 
 def get_textblob_sentiment(text: str) -> float:
     """
@@ -77,7 +186,7 @@ def get_textblob_sentiment(text: str) -> float:
         blob = TextBlob(text)
         return blob.sentiment.polarity
     except Exception as e:
-        print(f"❌ TextBlob sentiment failed: {str(e)}")
+        logger.error("❌ TextBlob sentiment failed: %s", e)
         return 0.0
 
 def get_vader_sentiment(text: str) -> float:
@@ -101,7 +210,7 @@ def get_vader_sentiment(text: str) -> float:
         # VADER returns a compound score that's already normalized
         return scores['compound']
     except Exception as e:
-        print(f"❌ VADER sentiment failed: {str(e)}")
+        logger.error("❌ VADER sentiment failed: %s", e)
         return 0.0
 
 def clean_text_for_sentiment(text: str) -> str:
@@ -123,21 +232,13 @@ def clean_text_for_sentiment(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove URLs (they don't contribute to sentiment)
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = _WS_RE.sub(' ', text.strip())
     
-    # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
-    
-    # Remove phone numbers
-    text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '', text)
+    # Remove URLs, email addresses and phone numbers
+    text = _NOISE_RE.sub('', text)
     
     # Remove excessive punctuation
-    text = re.sub(r'[!]{2,}', '!', text)
-    text = re.sub(r'[?]{2,}', '?', text)
-    text = re.sub(r'[.]{2,}', '.', text)
+    text = _PUNCT_RE.sub(r'\1', text)
     
     return text.strip()
 
@@ -206,9 +307,8 @@ def analyze_sentiment_detailed(text: str) -> Dict[str, any]:
         
         cleaned_text = clean_text_for_sentiment(text)
         
-        # Get individual scores
-        textblob_score = get_textblob_sentiment(cleaned_text)
-        vader_score = get_vader_sentiment(cleaned_text)
+        # Get individual scores (cached, shared with analyze_sentiment)
+        textblob_score, vader_score = _component_scores(cleaned_text)
         
         # Calculate final score
         final_score = (textblob_score + vader_score) / 2
@@ -226,7 +326,7 @@ def analyze_sentiment_detailed(text: str) -> Dict[str, any]:
         }
         
     except Exception as e:
-        print(f"❌ Detailed sentiment analysis failed: {str(e)}")
+        logger.error("❌ Detailed sentiment analysis failed: %s", e)
         return {
             'score': 0.0,
             'label': 'Neutral',
@@ -238,6 +338,8 @@ def analyze_sentiment_detailed(text: str) -> Dict[str, any]:
 
 # Test function for development
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    
     # Test sentiment analysis with sample texts
     test_texts = [
         "I love this app! It's amazing and makes me so happy! 😊",
@@ -15,6 +15,13 @@ function App() {
     setMemories(prevMemories => [newMemory, ...prevMemories]);
   };
 
+  // Function to replace a memory once its background processing is done
+  const handleMemoryUpdated = (updatedMemory) => {
+    setMemories(prevMemories => prevMemories.map(memory => (
+      memory.id === updatedMemory.id ? updatedMemory : memory
+    )));
+  };
+
   // Function to handle search results
   const handleSearchResults = (results) => {
     setSearchResults(results);
@@ -31,7 +38,10 @@ function App() {
         {/* Upload Section */}
         <section className="upload-section">
           <h2>Upload Memory</h2>
-          <UploadForm onMemoryUploaded={handleMemoryUploaded} />
+          <UploadForm
+            onMemoryUploaded={handleMemoryUploaded}
+            onMemoryUpdated={handleMemoryUpdated}
+          />
         </section>
 
         {/* Search Section */}
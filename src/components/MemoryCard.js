@@ -33,6 +33,8 @@ function MemoryCard({ memory }) {
 
   // Function to truncate text for display
   const truncateText = (text, maxLength = 150) => {
+    if (memory.status === 'pending') return '⏳ Processing...';
+    if (memory.status === 'failed') return '⚠️ Processing failed';
     if (!text) return 'No text extracted';
     return text.length > maxLength ? text.substring(0, maxLength) + '...' : text;
   };
@@ -1,7 +1,13 @@
 import React, { useState } from 'react';
 import './UploadForm.css';
 
-function UploadForm({ onMemoryUploaded }) {
+// How often and for how long to poll a new memory's processing status
+const STATUS_POLL_INTERVAL_MS = 1000;
+const STATUS_POLL_MAX_ATTEMPTS = 300; // 5 minutes
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+function UploadForm({ onMemoryUploaded, onMemoryUpdated }) {
   // State for form data and UI feedback
   const [formData, setFormData] = useState({
     file: null,
@@ -34,6 +40,35 @@ function UploadForm({ onMemoryUploaded }) {
     return null;
   };
 
+  // Function to wait for background processing (OCR/ASR, sentiment) to
+  // finish, then fetch the completed memory
+  const waitForProcessing = async (memoryId) => {
+    for (let attempt = 0; attempt < STATUS_POLL_MAX_ATTEMPTS; attempt++) {
+      await sleep(STATUS_POLL_INTERVAL_MS);
+
+      try {
+        const statusResponse = await fetch(`http://localhost:8000/api/memory/${memoryId}/status`);
+        if (!statusResponse.ok) {
+          continue;
+        }
+
+        const statusResult = await statusResponse.json();
+        if (statusResult.processing_status === 'pending') {
+          continue;
+        }
+
+        const memoryResponse = await fetch(`http://localhost:8000/api/memory/${memoryId}`);
+        if (memoryResponse.ok) {
+          const memoryResult = await memoryResponse.json();
+          onMemoryUpdated(memoryResult.memory);
+        }
+        return;
+      } catch (error) {
+        console.error('Status check error:', error);
+      }
+    }
+  };
+
   // Function to handle file selection
   const handleFileChange = (event) => {
     const file = event.target.files[0];
@@ -112,8 +147,12 @@ function UploadForm({ onMemoryUploaded }) {
       const result = await response.json();
       
       if (result.status === 'ok') {
-        setSuccess('Memory uploaded successfully!');
+        setSuccess('Memory uploaded! Processing in the background...');
         onMemoryUploaded(result.memory);
+
+        // The upload returns before OCR/ASR has run; replace the pending
+        // memory with the finished one once processing is done
+        waitForProcessing(result.memory.id);
         
         // Reset form
         setFormData({ file: null, title: '', person: '' });